@@ -9,9 +9,14 @@ import customtkinter as ctk
 from typing import Optional, Callable
 from pathlib import Path
 import threading
+import time
+import queue
 import http.server
 import socketserver
-import time
+import socket
+import shutil
+import json
+import gzip
 from urllib.parse import quote, unquote
 
 CEF_AVAILABLE = False
@@ -36,6 +41,288 @@ except Exception as e:
         # Raise ImportError so main.py will fall back
         raise ImportError(f"CEF not available: {error_msg}") from e
 
+# CEF only supports running its own message-loop thread on Windows; elsewhere
+# Tk has to pump MessageLoopWork() itself
+CEF_MULTI_THREADED_LOOP = CEF_AVAILABLE and sys.platform == 'win32'
+
+# Chromium switches that keep three.js on the GPU. Set VIEWER_CEF_DISABLE_GPU=1 to
+# fall back to CEF's defaults on machines with broken graphics drivers.
+CEF_GPU_SWITCHES = {
+    "enable-gpu": "",
+    "enable-gpu-rasterization": "",
+    "enable-webgl": "",
+    "ignore-gpu-blocklist": "",
+}
+
+# Message pump cadence for the single-threaded loop: fast while the page starts up, loads a
+# model (up to CEF_LOAD_WINDOW seconds) or reports user input (window.onViewerActivity -
+# CEF's child window takes all mouse/keyboard input, so Tk can't see it), relaxed
+# CEF_ACTIVE_WINDOW seconds after that
+CEF_ACTIVE_INTERVAL_MS = 8
+CEF_IDLE_INTERVAL_MS = 50
+CEF_ACTIVE_WINDOW = 1.0
+CEF_LOAD_WINDOW = 10.0
+
+# How often Tk runs callbacks queued from CEF's own UI thread (multi-threaded loop only)
+CEF_CALLBACK_POLL_MS = 50
+
+# Block size used to copy model files when sendfile is unavailable (e.g. Windows).
+# 512 KB keeps syscalls low without stalling on a full socket send buffer.
+# VIEWER_CHUNK_SIZE overrides it; a malformed value must not break importing the viewer.
+SERVE_CHUNK_SIZE = 512 * 1024
+try:
+    _chunk_size = int(os.environ.get('VIEWER_CHUNK_SIZE', SERVE_CHUNK_SIZE))
+except ValueError:
+    _chunk_size = 0
+if _chunk_size > 0:
+    SERVE_CHUNK_SIZE = _chunk_size
+else:
+    print(f"Ignoring invalid VIEWER_CHUNK_SIZE; using {SERVE_CHUNK_SIZE} bytes")
+
+# Content types for viewer assets; anything else is served as octet-stream
+CONTENT_TYPES = {
+    '.js': 'application/javascript',
+    '.css': 'text/css',
+    '.html': 'text/html',
+    '.wasm': 'application/wasm',
+}
+
+# Assets worth pre-compressing; CEF always sends Accept-Encoding: gzip
+GZIP_SUFFIXES = ('.js', '.wasm', '.html', '.css')
+
+# Per-connection kernel socket buffers, large enough to keep several chunks in flight
+SOCKET_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Linux-only hint that more data follows, letting TCP merge headers with a sendfile body
+SEND_MORE_FLAG = getattr(socket, 'MSG_MORE', 0)
+
+# Draco decoder names requested by the loaders, mapped to the files we ship
+DRACO_ALIASES = {
+    'draco_decoder.js': 'draco_decoder_gltf.js',
+    'draco_wasm_wrapper.js': 'draco_decoder_gltf.js',
+    'draco_decoder.wasm': 'draco_decoder_gltf.wasm',
+}
+
+
+class ViewerHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves the viewer page, its assets and the current model for the embedded browser."""
+    
+    # Buffer writes so status line, headers and small bodies leave together
+    wbufsize = 1024 * 1024
+    
+    def __init__(self, *args, viewer_dir=None, canvas_ref=None, static_cache=None,
+                 gzip_cache=None, routes=None, **kwargs):
+        self.viewer_dir = viewer_dir
+        self.canvas_ref = canvas_ref  # Reference to WebViewCanvas instance
+        self.static_cache = static_cache if static_cache is not None else {}
+        self.gzip_cache = gzip_cache if gzip_cache is not None else {}
+        self.routes = routes if routes is not None else {}  # Request path -> static_cache key
+        super().__init__(*args, **kwargs)
+    
+    def _send_cached(self, key):
+        """Send a preloaded asset in a single write, gzipped when the client accepts it."""
+        body, content_type = self.static_cache[key]
+        gzipped = self.gzip_cache.get(key)
+        use_gzip = gzipped is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+        if use_gzip:
+            body = gzipped
+        
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        if gzipped is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self._send_head_and_body(body)
+    
+    def _send_head_and_body(self, body=b'', flags=0):
+        """Finish the buffered headers and send them with ``body`` in one vectored write."""
+        buffers = self._headers_buffer
+        buffers.append(b"\r\n")
+        if body:
+            buffers.append(body)
+        self._headers_buffer = []
+        self.wfile.flush()
+        
+        if not hasattr(self.connection, 'sendmsg'):
+            # No sendmsg (Windows) - join and write once instead
+            self.wfile.write(b''.join(buffers))
+            return
+        
+        views = [memoryview(buf) for buf in buffers]
+        while views:
+            sent = self.connection.sendmsg(views, [], flags)
+            # Drop fully sent buffers and trim a partially sent one
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if sent:
+                views[0] = views[0][sent:]
+    
+    def setup(self):
+        """Tune the accepted connection before anything is written to it."""
+        super().setup()
+        # Disable Nagle so writes are not held for ACKs
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Enlarge the socket buffers; the kernel clamps them to its own limits
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    
+    def do_GET(self):
+        """Handle GET requests."""
+        # Drop the query; only percent-decode paths that are actually escaped
+        path = self.path.partition('?')[0].lstrip('/')
+        if '%' in path:
+            path = unquote(path)
+        
+        # Preloaded assets (including '/' -> index.html) resolve with one lookup
+        cache_key = self.routes.get(path)
+        if cache_key is not None:
+            self._send_cached(cache_key)
+        elif path.startswith('model/'):
+            self._serve_model()
+        elif path == '' or path == 'index.html':
+            self._serve_index_from_disk()
+        else:
+            self._serve_file_from_disk(path)
+    
+    def _serve_model(self):
+        """Serve the GLTF file currently loaded in the canvas via the /model/ route."""
+        model_ref, model_fd = self.canvas_ref.acquire_model() if self.canvas_ref else (None, None)
+        
+        try:
+            if model_ref and (model_fd is not None or os.path.exists(model_ref[0])):
+                current_file, _, file_size = model_ref
+                if model_fd is None:
+                    file_size = os.path.getsize(current_file)
+                
+                # Serve the GLTF file
+                self.send_response(200)
+                # Set appropriate content type
+                if current_file.endswith('.gltf'):
+                    self.send_header('Content-type', 'model/gltf+json')
+                elif current_file.endswith('.glb'):
+                    self.send_header('Content-type', 'model/gltf-binary')
+                else:
+                    self.send_header('Content-type', 'application/octet-stream')
+                self.send_header('Content-Length', str(file_size))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                
+                if model_fd is not None:
+                    # Headers go out corked so they share a segment with the payload
+                    self._send_head_and_body(flags=SEND_MORE_FLAG)
+                    # Zero-copy from this request's duplicate of the model descriptor.
+                    # An explicit offset leaves the shared file position untouched.
+                    out_fd = self.connection.fileno()
+                    offset = 0
+                    while offset < file_size:
+                        sent = os.sendfile(out_fd, model_fd, offset, file_size - offset)
+                        if not sent:
+                            break
+                        offset += sent
+                else:
+                    # No os.sendfile (Windows) - buffered copy from the path
+                    self.end_headers()
+                    with open(current_file, 'rb') as f:
+                        shutil.copyfileobj(f, self.wfile, SERVE_CHUNK_SIZE)
+            else:
+                self.send_response(404)
+                self.send_header('Content-type', 'text/plain')
+                self.end_headers()
+                self.wfile.write(b'Model file not found')
+        finally:
+            if model_fd is not None:
+                os.close(model_fd)
+    
+    def _serve_index_from_disk(self):
+        """Serve index.html when it was not available at startup."""
+        html_file = self.viewer_dir / 'index.html'
+        if html_file.exists():
+            # Keep the raw bytes (no decode/encode round-trip) so reloads hit the cache
+            self.static_cache['index.html'] = (html_file.read_bytes(), 'text/html')
+            self.routes['index.html'] = 'index.html'
+            self.routes[''] = 'index.html'
+            self._send_cached('index.html')
+        else:
+            self.send_response(404)
+            self.end_headers()
+    
+    def _serve_file_from_disk(self, path):
+        """Serve a viewer file that is not in the startup cache."""
+        file_path = self.viewer_dir / path
+        
+        # Missing draco decoder files fall back to the bundled glTF build
+        if not file_path.exists():
+            alias = DRACO_ALIASES.get(path.rpartition('/')[2])
+            if alias and (self.viewer_dir / alias).exists():
+                file_path = self.viewer_dir / alias
+        
+        if file_path.exists() and file_path.is_file():
+            self.send_response(200)
+            # Set appropriate content type
+            if path.endswith('.js') or file_path.suffix == '.js':
+                self.send_header('Content-type', 'application/javascript')
+            elif path.endswith('.css') or file_path.suffix == '.css':
+                self.send_header('Content-type', 'text/css')
+            elif path.endswith('.html') or file_path.suffix == '.html':
+                self.send_header('Content-type', 'text/html')
+            elif path.endswith('.wasm') or file_path.suffix == '.wasm':
+                self.send_header('Content-type', 'application/wasm')
+            else:
+                self.send_header('Content-type', 'application/octet-stream')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            
+            with open(file_path, 'rb') as f:
+                self.wfile.write(f.read())
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        """Suppress server logs."""
+        pass
+
+
+class ViewerHTTPServer(socketserver.ThreadingTCPServer):
+    """Threaded viewer server that signals readiness as soon as it is listening."""
+    
+    # CEF fetches index.html, the viewer scripts, draco and the model in one burst;
+    # the default backlog of 5 drops connections and forces SYN retries
+    request_queue_size = 64
+    # Per-request threads never hold up shutdown or app exit
+    daemon_threads = True
+    block_on_close = False
+    
+    def __init__(self, server_address, RequestHandlerClass, viewer_dir=None, canvas_ref=None,
+                 static_cache=None, gzip_cache=None, routes=None):
+        self.ready_event = threading.Event()
+        # Shared by every handler; the canvas fills these before the server starts
+        self.viewer_dir = viewer_dir
+        self.canvas_ref = canvas_ref
+        self.static_cache = static_cache if static_cache is not None else {}
+        self.gzip_cache = gzip_cache if gzip_cache is not None else {}
+        self.routes = routes if routes is not None else {}
+        super().__init__(server_address, RequestHandlerClass)
+    
+    def finish_request(self, request, client_address):
+        """Hand the shared viewer state to the handler instead of going through a factory."""
+        self.RequestHandlerClass(
+            request, client_address, self,
+            viewer_dir=self.viewer_dir,
+            canvas_ref=self.canvas_ref,
+            static_cache=self.static_cache,
+            gzip_cache=self.gzip_cache,
+            routes=self.routes,
+        )
+    
+    def server_activate(self):
+        """Start listening, then release anyone waiting on ready_event."""
+        super().server_activate()
+        self.ready_event.set()
+
 
 class WebViewCanvas(ctk.CTkFrame):
     """
@@ -63,11 +350,22 @@ class WebViewCanvas(ctk.CTkFrame):
         
         # State
         self.current_file: Optional[str] = None
+        # (path, fd or None, size) of the loaded model, opened once in load_gltf. Requests
+        # dup the fd under model_lock, and the canvas only closes it under the same lock,
+        # so a model swap can never close (and recycle) a descriptor a request still uses.
+        self.model_ref: Optional[tuple] = None
+        self.model_lock = threading.Lock()
         self.model_stats: Optional[dict] = None
         self.browser = None
         self.cef_initialized = False
+        self.viewer_ready = False  # Set by the page once window.viewer exists
+        self._fast_pump_until = 0.0  # time.monotonic() until which the pump stays fast
+        self._tk_calls = queue.Queue()  # (func, args) from CEF's UI thread, run by Tk
         
         # HTTP server for serving files
+        self.static_cache: dict = {}  # Relative path -> (bytes, content type)
+        self.gzip_cache: dict = {}  # Relative path -> gzip-compressed bytes
+        self.static_routes: dict = {}  # Request path -> static_cache key
         self.http_server: Optional[socketserver.TCPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self.server_port = 8765
@@ -108,146 +406,65 @@ class WebViewCanvas(ctk.CTkFrame):
                     path_str = path_str.replace('\\', '/')
                 return f"file:///{path_str}/index.html"
     
+    def _load_static_assets(self) -> dict:
+        """Read every file under the viewer directory into memory, keyed by relative path."""
+        cache = {}
+        for root, _dirs, files in os.walk(self.viewer_dir):
+            for name in files:
+                file_path = Path(root) / name
+                key = file_path.relative_to(self.viewer_dir).as_posix()
+                content_type = CONTENT_TYPES.get(file_path.suffix, 'application/octet-stream')
+                try:
+                    cache[key] = (file_path.read_bytes(), content_type)
+                except OSError as e:
+                    print(f"Could not cache {key}: {e}")
+        
+        # Resolve draco aliases up front so those requests are cache hits too
+        for alias, target in DRACO_ALIASES.items():
+            if alias not in cache and target in cache:
+                cache[alias] = cache[target]
+        
+        return cache
+    
+    def _compress_static_assets(self, cache: dict) -> dict:
+        """Gzip compressible cached assets once; aliases share their target's result."""
+        compressed = {}
+        by_body = {}
+        for key, (body, _content_type) in cache.items():
+            if not key.endswith(GZIP_SUFFIXES):
+                continue
+            if id(body) not in by_body:
+                by_body[id(body)] = gzip.compress(body, compresslevel=6)
+            if len(by_body[id(body)]) < len(body):
+                compressed[key] = by_body[id(body)]
+        return compressed
+    
     def _start_local_server(self):
         """Start a local HTTP server to serve viewer files."""
         if self.server_started and self.http_server:
             return
         
         try:
-            class ViewerHandler(http.server.SimpleHTTPRequestHandler):
-                def __init__(self, *args, viewer_dir=None, canvas_ref=None, **kwargs):
-                    self.viewer_dir = viewer_dir
-                    self.canvas_ref = canvas_ref  # Reference to WebViewCanvas instance
-                    super().__init__(*args, **kwargs)
-                
-                def do_GET(self):
-                    """Handle GET requests."""
-                    # Parse path and query
-                    parsed_path = self.path.split('?')[0]
-                    path = unquote(parsed_path.lstrip('/'))
-                    
-                    # Serve GLTF files via /model/ route
-                    if path.startswith('model/'):
-                        # Extract file identifier from path
-                        file_id = path.replace('model/', '')
-                        current_file = None
-                        if self.canvas_ref:
-                            current_file = self.canvas_ref.current_file
-                        
-                        if current_file and os.path.exists(current_file):
-                            # Get file size for proper header and chunked streaming
-                            file_size = os.path.getsize(current_file)
-                            
-                            # Serve the GLTF file
-                            self.send_response(200)
-                            # Set appropriate content type
-                            if current_file.endswith('.gltf'):
-                                self.send_header('Content-type', 'model/gltf+json')
-                            elif current_file.endswith('.glb'):
-                                self.send_header('Content-type', 'model/gltf-binary')
-                            else:
-                                self.send_header('Content-type', 'application/octet-stream')
-                            self.send_header('Content-Length', str(file_size))
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            
-                            # Use chunked streaming for large files (read in 8MB chunks)
-                            # This prevents loading entire file into memory
-                            chunk_size = 8 * 1024 * 1024  # 8MB chunks
-                            with open(current_file, 'rb') as f:
-                                while True:
-                                    chunk = f.read(chunk_size)
-                                    if not chunk:
-                                        break
-                                    self.wfile.write(chunk)
-                                    # Flush to ensure data is sent immediately
-                                    self.wfile.flush()
-                        else:
-                            self.send_response(404)
-                            self.send_header('Content-type', 'text/plain')
-                            self.end_headers()
-                            self.wfile.write(b'Model file not found')
-                    
-                    # Serve index.html with file parameter
-                    elif path == '' or path == 'index.html':
-                        # Get current file from canvas reference
-                        current_file = None
-                        if self.canvas_ref:
-                            current_file = self.canvas_ref.current_file
-                        
-                        html_file = self.viewer_dir / 'index.html'
-                        if html_file.exists():
-                            html_content = html_file.read_text(encoding='utf-8')
-                            self.send_response(200)
-                            self.send_header('Content-type', 'text/html')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(html_content.encode())
-                        else:
-                            self.send_response(404)
-                            self.end_headers()
-                    
-                    # Serve other files from viewer directory
-                    else:
-                        file_path = self.viewer_dir / path
-                        
-                        # Handle draco decoder files
-                        if path == 'draco_decoder.js' or path.endswith('/draco_decoder.js'):
-                            if not file_path.exists():
-                                draco_path = self.viewer_dir / 'draco_decoder_gltf.js'
-                                if draco_path.exists():
-                                    file_path = draco_path
-                        elif path == 'draco_wasm_wrapper.js' or path.endswith('/draco_wasm_wrapper.js'):
-                            # Alias wasm wrapper to draco_decoder_gltf.js if wrapper is missing
-                            if not file_path.exists():
-                                alias_path = self.viewer_dir / 'draco_decoder_gltf.js'
-                                if alias_path.exists():
-                                    file_path = alias_path
-                        elif path == 'draco_decoder.wasm' or path.endswith('/draco_decoder.wasm'):
-                            if not file_path.exists():
-                                draco_path = self.viewer_dir / 'draco_decoder_gltf.wasm'
-                                if draco_path.exists():
-                                    file_path = draco_path
-                        
-                        if file_path.exists() and file_path.is_file():
-                            self.send_response(200)
-                            # Set appropriate content type
-                            if path.endswith('.js') or file_path.suffix == '.js':
-                                self.send_header('Content-type', 'application/javascript')
-                            elif path.endswith('.css') or file_path.suffix == '.css':
-                                self.send_header('Content-type', 'text/css')
-                            elif path.endswith('.html') or file_path.suffix == '.html':
-                                self.send_header('Content-type', 'text/html')
-                            elif path.endswith('.wasm') or file_path.suffix == '.wasm':
-                                self.send_header('Content-type', 'application/wasm')
-                            else:
-                                self.send_header('Content-type', 'application/octet-stream')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            
-                            with open(file_path, 'rb') as f:
-                                self.wfile.write(f.read())
-                        else:
-                            self.send_response(404)
-                            self.end_headers()
-                
-                def log_message(self, format, *args):
-                    """Suppress server logs."""
-                    pass
-            
-            # Create handler factory with canvas reference
-            handler_factory = lambda *args, **kwargs: ViewerHandler(
-                *args, 
-                viewer_dir=self.viewer_dir,
-                canvas_ref=self,  # Pass self so handler can access current_file dynamically
-                **kwargs
-            )
+            # Preload viewer assets so page reloads are served without touching the disk
+            self.static_cache = self._load_static_assets()
+            self.gzip_cache = self._compress_static_assets(self.static_cache)
+            self.static_routes = {key: key for key in self.static_cache}
+            if 'index.html' in self.static_cache:
+                self.static_routes[''] = 'index.html'
             
             # Try to find available port
             for port in range(self.server_port, self.server_port + 10):
                 try:
-                    # Use ThreadingTCPServer for better handling
-                    self.http_server = socketserver.ThreadingTCPServer(("", port), handler_factory)
+                    # Threaded server that flags readiness from server_activate()
+                    self.http_server = ViewerHTTPServer(
+                        ("", port),
+                        ViewerHandler,
+                        viewer_dir=self.viewer_dir,
+                        canvas_ref=self,  # Handlers take the model via acquire_model() per request
+                        static_cache=self.static_cache,
+                        gzip_cache=self.gzip_cache,
+                        routes=self.static_routes,
+                    )
                     self.http_server.allow_reuse_address = True
                     self.http_server.timeout = 1.0
                     self.server_port = port
@@ -258,29 +475,22 @@ class WebViewCanvas(ctk.CTkFrame):
                     continue
             
             if self.http_server:
-                # Start server in a way that ensures it binds before continuing
-                server_event = threading.Event()
-                
                 def serve():
                     try:
-                        print(f"Starting HTTP server on port {self.server_port}...")
-                        time.sleep(0.2)
-                        server_event.set()
                         print(f"Server serving on port {self.server_port}")
                         self.http_server.serve_forever()
                     except Exception as e:
                         print(f"Server error: {e}")
                         import traceback
                         traceback.print_exc()
-                        server_event.set()  # Set anyway to unblock
                 
                 # Start server thread
                 self.server_thread = threading.Thread(target=serve, daemon=True)
                 self.server_thread.start()
                 self.server_started = True
                 
-                # Wait for server to actually bind
-                if server_event.wait(timeout=3.0):
+                # Connections queue on the listening socket from here on
+                if self.http_server.ready_event.wait(timeout=3.0):
                     print(f"Server confirmed ready on port {self.server_port}")
                 else:
                     print(f"Warning: Server binding timeout on port {self.server_port}")
@@ -325,10 +535,17 @@ class WebViewCanvas(ctk.CTkFrame):
                     "debug": False,
                     "log_severity": cef.LOGSEVERITY_INFO,
                     "log_file": "debug.log",
+                    "multi_threaded_message_loop": CEF_MULTI_THREADED_LOOP,
+                    # Browser is embedded as a native child window, not rendered offscreen
+                    "windowless_rendering_enabled": False,
                 }
                 
+                switches = {}
+                if not os.environ.get('VIEWER_CEF_DISABLE_GPU'):
+                    switches.update(CEF_GPU_SWITCHES)
+                
                 # Initialize CEF (only once globally)
-                cef.Initialize(settings)
+                cef.Initialize(settings, switches)
                 cef._initialized = True
             
             # Get window handle
@@ -347,14 +564,11 @@ class WebViewCanvas(ctk.CTkFrame):
             window_info.SetAsChild(window_handle, [0, 0, width, height])
             
             # Create browser
-            self.browser = cef.CreateBrowserSync(
-                window_info,
-                url=self._get_html_url()
-            )
-            
-            # Set up message handler
-            handler = MessageHandler(self)
-            self.browser.SetClientHandler(handler)
+            if CEF_MULTI_THREADED_LOOP:
+                # CEF owns its UI thread here, and browsers must be created on it
+                cef.PostTask(cef.TID_UI, self._create_browser, window_info)
+            else:
+                self._create_browser(window_info)
             
             # Hide placeholder
             try:
@@ -369,8 +583,12 @@ class WebViewCanvas(ctk.CTkFrame):
             self.unbind('<Configure>')
             self.bind('<Configure>', self._on_resize)
             
-            # Start CEF message loop processing (required for CEF to work)
-            self._process_cef_messages()
+            # Pump the CEF message loop from Tk unless CEF runs its own thread, in which
+            # case its handlers fire there and Tk picks up their callbacks instead
+            if CEF_MULTI_THREADED_LOOP:
+                self._process_tk_calls()
+            else:
+                self._process_cef_messages()
             
             return True
             
@@ -380,9 +598,33 @@ class WebViewCanvas(ctk.CTkFrame):
             traceback.print_exc()
             return False
     
+    def _create_browser(self, window_info):
+        """Create the CEF browser and hook up handlers (runs on the CEF UI thread)."""
+        browser = cef.CreateBrowserSync(
+            window_info,
+            url=self._get_html_url()
+        )
+        
+        # Set up message handler
+        handler = MessageHandler(self)
+        browser.SetClientHandler(handler)
+        
+        # Page calls window.onViewerReady() once viewer.loadGLTF is usable
+        bindings = cef.JavascriptBindings(bindToFrames=False, bindToPopups=False)
+        bindings.SetFunction("onViewerReady", self.on_viewer_ready_callback)
+        # Page pings window.onViewerActivity() while the user drags, zooms or types
+        bindings.SetFunction("onViewerActivity", self.on_viewer_activity_callback)
+        browser.SetJavascriptBindings(bindings)
+        
+        self.browser = browser
+    
     def _process_cef_messages(self):
         """Process CEF message loop periodically (required for CEF to work with Tkinter)."""
         if self.cef_initialized and CEF_AVAILABLE:
+            if not self.winfo_viewable():
+                # Minimized or on a hidden tab - nothing to paint, just keep polling slowly
+                self.after(CEF_IDLE_INTERVAL_MS, self._process_cef_messages)
+                return
             try:
                 # Process CEF messages (non-blocking)
                 # cefpython3 requires periodic message processing when embedded
@@ -400,8 +642,33 @@ class WebViewCanvas(ctk.CTkFrame):
             except Exception:
                 # Ignore errors - CEF may handle messages automatically
                 pass
-            # Schedule next message loop processing (every 10ms for smooth rendering)
-            self.after(10, self._process_cef_messages)
+            self.after(self._message_loop_delay(), self._process_cef_messages)
+    
+    def _call_in_tk(self, func, *args):
+        """Run func on the Tk thread; CEF handlers may fire on CEF's own UI thread."""
+        if CEF_MULTI_THREADED_LOOP:
+            self._tk_calls.put((func, args))
+        else:
+            func(*args)
+    
+    def _process_tk_calls(self):
+        """Run callbacks queued from CEF's UI thread."""
+        try:
+            while not self._tk_calls.empty():
+                func, args = self._tk_calls.get_nowait()
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"Error in viewer callback: {e}")
+        except queue.Empty:
+            pass
+        self.after(CEF_CALLBACK_POLL_MS, self._process_tk_calls)
+    
+    def _message_loop_delay(self) -> int:
+        """Delay in ms before the next CEF message pump."""
+        if not self.viewer_ready or time.monotonic() < self._fast_pump_until:
+            return CEF_ACTIVE_INTERVAL_MS
+        return CEF_IDLE_INTERVAL_MS
     
     def _on_resize(self, event=None):
         """Handle widget resize - CEF handles resize automatically through window handle."""
@@ -418,35 +685,25 @@ class WebViewCanvas(ctk.CTkFrame):
             return False
         
         self.current_file = file_path
+        self._open_model_file(file_path)
+        # Keep the pump fast while the page fetches and renders the model
+        self._fast_pump_until = time.monotonic() + CEF_LOAD_WINDOW
         
         # Ensure server is running
         if not self.server_started:
             self._start_local_server()
         
-        # Wait for server to be ready
-        max_wait = 20
-        waited = 0
-        while waited < max_wait:
-            if self.server_port and self.server_started:
-                import socket
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.1)
-                    result = sock.connect_ex(('127.0.0.1', self.server_port))
-                    sock.close()
-                    if result == 0:
-                        break
-                except:
-                    pass
-            time.sleep(0.1)
-            waited += 1
+        # Wait for server to be listening (set from server_activate)
+        if self.http_server:
+            self.http_server.ready_event.wait(timeout=2.0)
         
         # Initialize CEF if not already done
-        if not self.cef_initialized or self.browser is None:
-            if not self._initialize_cef():
-                # Try again after widget is ready
-                self.after(500, lambda: self.load_gltf(file_path))
-                return True
+        if not self.cef_initialized:
+            self._initialize_cef()
+        if self.browser is None:
+            # Widget not ready yet, or the browser is still being created on CEF's UI thread
+            self.after(500, lambda: self._retry_load(file_path))
+            return True
         
         try:
             # Use HTTP URL for file (same approach as browser viewer)
@@ -459,20 +716,14 @@ class WebViewCanvas(ctk.CTkFrame):
                 if sys.platform == 'win32':
                     file_url = file_url.replace('\\', '/')
             
-            # Load URL with file parameter
-            html_url = self._get_html_url()
-            full_url = f"{html_url}?file={quote(file_url, safe='')}"
-            self.browser.LoadUrl(full_url)
-            
-            # Also try to load via JavaScript after a delay
-            def load_via_js():
-                try:
-                    js_code = f"if (typeof viewer !== 'undefined' && viewer) {{ viewer.loadGLTF('{file_url}'); }}"
-                    self.browser.ExecuteJavascript(js_code)
-                except Exception as e:
-                    print(f"Error loading via JS: {e}")
-            
-            self.after(500, load_via_js)
+            if self.viewer_ready:
+                # Page is live - swap the model without reloading three.js and draco
+                self.browser.ExecuteJavascript(f"viewer.loadGLTF({json.dumps(file_url)});")
+            else:
+                # Page still starting up - it loads the model from the file parameter
+                html_url = self._get_html_url()
+                full_url = f"{html_url}?file={quote(file_url, safe='')}"
+                self.browser.LoadUrl(full_url)
             
             return True
         except Exception as e:
@@ -481,6 +732,52 @@ class WebViewCanvas(ctk.CTkFrame):
             traceback.print_exc()
             return False
     
+    def _open_model_file(self, file_path: str):
+        """Open the model once so requests can sendfile it without reopening the path."""
+        fd = None
+        size = 0
+        # Without os.sendfile (Windows) the handler copies from the path instead,
+        # and an open handle would only stop the user from replacing the file
+        if hasattr(os, 'sendfile'):
+            try:
+                fd = os.open(file_path, os.O_RDONLY)
+                size = os.fstat(fd).st_size
+            except OSError as e:
+                print(f"Could not open model for streaming: {e}")
+                fd = None
+        self._swap_model_ref((file_path, fd, size))
+    
+    def _close_model_file(self):
+        """Release the descriptor held for the current model."""
+        self._swap_model_ref(None)
+    
+    def _swap_model_ref(self, model_ref: Optional[tuple]):
+        """Publish a new model snapshot and close the previous descriptor."""
+        with self.model_lock:
+            previous_ref = self.model_ref
+            self.model_ref = model_ref
+            # Requests streaming the previous model hold their own dup of it
+            if previous_ref and previous_ref[1] is not None:
+                os.close(previous_ref[1])
+    
+    def acquire_model(self):
+        """
+        Snapshot the current model for one request.
+        
+        Returns (model_ref, fd): fd is a private duplicate of the model descriptor that
+        the caller must close, or None when the model is served from its path.
+        """
+        with self.model_lock:
+            model_ref = self.model_ref
+            if model_ref and model_ref[1] is not None:
+                return model_ref, os.dup(model_ref[1])
+            return model_ref, None
+    
+    def _retry_load(self, file_path: str):
+        """Retry a deferred load unless another model (or clear) has replaced it."""
+        if self.current_file == file_path:
+            self.load_gltf(file_path)
+    
     def reset_view(self):
         """Reset camera view."""
         if self.browser:
@@ -506,6 +803,7 @@ class WebViewCanvas(ctk.CTkFrame):
                 pass
         
         self.current_file = None
+        self._close_model_file()
         self.model_stats = None
         
         # Show placeholder again
@@ -515,14 +813,25 @@ class WebViewCanvas(ctk.CTkFrame):
         except:
             self.placeholder_label.pack(expand=True)
     
+    def on_viewer_ready_callback(self):
+        """Called from JS once the viewer page has initialized."""
+        self.viewer_ready = True
+    
+    def on_viewer_activity_callback(self):
+        """Called from JS while the user interacts with the page."""
+        self._fast_pump_until = max(self._fast_pump_until, time.monotonic() + CEF_ACTIVE_WINDOW)
+    
     def on_model_loaded_callback(self, stats: dict):
         """Called when model loads."""
         self.model_stats = stats
+        # Loading is over; stay fast only for the first frames of the new model
+        self._fast_pump_until = time.monotonic() + CEF_ACTIVE_WINDOW
         if self.on_model_loaded:
             self.on_model_loaded(stats)
     
     def on_model_error_callback(self, error: str):
         """Called on model error."""
+        self._fast_pump_until = 0.0
         if self.on_model_error:
             self.on_model_error(error)
 
@@ -533,12 +842,18 @@ class MessageHandler(object):
     def __init__(self, canvas: WebViewCanvas):
         self.canvas = canvas
     
+    def OnLoadStart(self, browser, frame, **_):
+        """Page is (re)loading - the viewer has to report ready again."""
+        if frame.IsMain():
+            self.canvas.viewer_ready = False
+    
     def OnProcessMessageReceived(self, browser, source_process, message):
         """Handle messages from JavaScript."""
+        # The callbacks touch Tk widgets, so they run on the Tk thread
         if message.GetName() == "onModelLoaded":
             stats = message.GetArgumentList()
-            self.canvas.on_model_loaded_callback(stats)
+            self.canvas._call_in_tk(self.canvas.on_model_loaded_callback, stats)
         elif message.GetName() == "onModelError":
             error = message.GetArgumentList()[0]
-            self.canvas.on_model_error_callback(error)
+            self.canvas._call_in_tk(self.canvas.on_model_error_callback, error)
 
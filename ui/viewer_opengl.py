@@ -8,6 +8,7 @@ import sys
 import customtkinter as ctk
 from typing import Optional, Callable
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 try:
     import numpy as np
     NUMPY_AVAILABLE = True
@@ -31,6 +32,14 @@ except ImportError:
     TRIMESH_AVAILABLE = False
     print("Note: trimesh not available. Install with: pip install trimesh")
 
+# Only geometry is needed for the stats shown here, so skip trimesh's processing
+# (merge/validate/normals) and material/texture decoding. Material and texture
+# counts are therefore not reported by this viewer.
+TRIMESH_LOAD_OPTIONS = {'process': False, 'skip_materials': True}
+
+# Models are parsed off the Tk main thread so large files don't freeze the UI
+LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gltf-load")
+
 
 class WebViewCanvas(ctk.CTkFrame):
     """
@@ -74,7 +83,10 @@ class WebViewCanvas(ctk.CTkFrame):
             )
     
     def load_gltf(self, file_path: str):
-        """Load GLTF file using trimesh."""
+        """Start loading a GLTF file with trimesh (geometry only; materials/textures are not counted).
+        
+        Parsing runs on LOAD_EXECUTOR; results are applied on the Tk thread.
+        """
         if not os.path.exists(file_path):
             return False
         
@@ -86,57 +98,83 @@ class WebViewCanvas(ctk.CTkFrame):
                 self.on_model_error(error_msg)
             return False
         
+        self.placeholder_label.configure(text=f"Loading: {os.path.basename(file_path)}...")
+        
+        future = LOAD_EXECUTOR.submit(self._load_mesh, file_path)
+        self.after(50, lambda: self._poll_load(future, file_path))
+        return True
+    
+    def _load_mesh(self, file_path: str):
+        """Load a model and count its elements (runs on a worker thread - no Tk calls)."""
+        # Load with trimesh (geometry only - see TRIMESH_LOAD_OPTIONS)
+        mesh = trimesh.load(file_path, **TRIMESH_LOAD_OPTIONS)
+        if mesh is None:
+            return None, 0, 0
+        vertices, faces = self._count_elements(mesh)
+        return mesh, vertices, faces
+    
+    def _poll_load(self, future, file_path: str):
+        """Wait for a background load on the Tk thread, then apply its result."""
+        if not future.done():
+            self.after(50, lambda: self._poll_load(future, file_path))
+            return
+        
+        # A newer load_gltf() or clear() superseded this one
+        if file_path != self.current_file:
+            return
+        
         try:
-            # Load with trimesh
-            import trimesh
-            scene = trimesh.load(file_path)
-            
-            # Get mesh data
-            if isinstance(scene, trimesh.Scene):
-                # Combine all meshes in scene
-                self.mesh = scene.dump(concatenate=True)
-            else:
-                self.mesh = scene
-            
-            # Calculate statistics
-            if self.mesh:
-                vertices = len(self.mesh.vertices)
-                faces = len(self.mesh.faces)
-                
-                stats = {
-                    'vertices': vertices,
-                    'faces': faces,
-                    'materials': 1,  # Simplified
-                    'textures': 0,
-                    'animations': 0
-                }
-                
-                self.model_stats = stats
-                
-                # Update display
-                self.placeholder_label.configure(
-                    text=f"Model loaded: {os.path.basename(file_path)}\n"
-                         f"Vertices: {vertices:,}\n"
-                         f"Faces: {faces:,}\n"
-                         f"\nNote: 3D rendering requires OpenGL canvas.\n"
-                         f"Using trimesh for model data."
-                )
-                
-                if self.on_model_loaded:
-                    self.on_model_loaded(stats)
-                
-                return True
-            else:
-                if self.on_model_error:
-                    self.on_model_error("Failed to extract mesh data")
-                return False
-                
+            mesh, vertices, faces = future.result()
         except Exception as e:
             error_msg = f"Failed to load GLTF: {str(e)}"
             print(error_msg)
             if self.on_model_error:
                 self.on_model_error(error_msg)
-            return False
+            return
+        
+        self.mesh = mesh
+        
+        # Calculate statistics
+        if self.mesh is not None:
+            stats = {
+                'vertices': vertices,
+                'faces': faces,
+                'materials': 1,  # Simplified
+                'textures': 0,
+                'animations': 0
+            }
+            
+            self.model_stats = stats
+            
+            # Update display
+            self.placeholder_label.configure(
+                text=f"Model loaded: {os.path.basename(file_path)}\n"
+                     f"Vertices: {vertices:,}\n"
+                     f"Faces: {faces:,}\n"
+                     f"\nNote: 3D rendering requires OpenGL canvas.\n"
+                     f"Using trimesh for model data."
+            )
+            
+            if self.on_model_loaded:
+                self.on_model_loaded(stats)
+        else:
+            if self.on_model_error:
+                self.on_model_error("Failed to extract mesh data")
+    
+    def _count_elements(self, loaded):
+        """Return (vertices, faces) for a trimesh Scene or Trimesh without concatenating."""
+        if not isinstance(loaded, trimesh.Scene):
+            return len(loaded.vertices), len(loaded.faces)
+        
+        # Count every placed instance, matching what scene.dump(concatenate=True) would yield
+        vertices = 0
+        faces = 0
+        for node_name in loaded.graph.nodes_geometry:
+            _transform, geometry_name = loaded.graph[node_name]
+            geometry = loaded.geometry[geometry_name]
+            vertices += len(geometry.vertices)
+            faces += len(getattr(geometry, 'faces', ()))
+        return vertices, faces
     
     def reset_view(self):
         """Reset camera to default."""
@@ -17,6 +17,14 @@ except ImportError:
     print("NumPy required for 3D rendering")
 
 try:
+    import OpenGL
+    # PyOpenGL checks glGetError, array sizes and logs around every call; these flags
+    # must be set before OpenGL.GL is imported. Set VIEWER_GL_DEBUG=1 to keep the checks.
+    if not os.environ.get('VIEWER_GL_DEBUG'):
+        OpenGL.ERROR_CHECKING = False
+        OpenGL.ERROR_LOGGING = False
+        OpenGL.ARRAY_SIZE_CHECKING = False
+        OpenGL.STORE_POINTERS = False
     from OpenGL.GL import *
     from OpenGL.GLU import *
     import tkinter as tk
@@ -44,6 +52,125 @@ except ImportError:
     TRIMESH_AVAILABLE = False
     print("trimesh required for GLTF loading")
 
+try:
+    # Optional: draws the mesh from GPU buffers instead of per-vertex GL calls
+    import moderngl
+    MODERNGL_AVAILABLE = True
+except ImportError:
+    MODERNGL_AVAILABLE = False
+    print("Note: moderngl not available, falling back to immediate-mode drawing")
+
+
+# Meshes with more faces than this are simplified for display; the file itself is untouched
+DECIMATION_FACE_LIMIT = 500_000
+
+MESH_VERTEX_SHADER = """
+#version 330
+uniform mat4 mvp;
+uniform mat3 normal_matrix;
+uniform float position_scale;
+in vec3 in_vert;
+in vec3 in_normal;
+in vec3 in_color;
+out vec3 v_normal;
+out vec3 v_color;
+void main() {
+    v_normal = normal_matrix * in_normal;
+    v_color = in_color;
+    gl_Position = mvp * vec4(in_vert * position_scale, 1.0);
+}
+"""
+
+# Same directional light as the fixed-function setup in _init_opengl (eye space, 0.2 ambient).
+# lit is off in wireframe mode, matching the unlit lines of the display-list path.
+MESH_FRAGMENT_SHADER = """
+#version 330
+uniform bool lit;
+in vec3 v_normal;
+in vec3 v_color;
+out vec4 frag_color;
+const vec3 light_dir = vec3(0.57735, 0.57735, 0.57735);
+void main() {
+    if (!lit) {
+        frag_color = vec4(v_color, 1.0);
+        return;
+    }
+    float diffuse = max(dot(normalize(v_normal), light_dir), 0.0);
+    frag_color = vec4(v_color * (0.2 + diffuse), 1.0);
+}
+"""
+
+AXES_VERTEX_SHADER = """
+#version 330
+uniform mat4 mvp;
+in vec3 in_pos;
+in vec3 in_color;
+out vec3 v_color;
+void main() {
+    v_color = in_color;
+    gl_Position = mvp * vec4(in_pos, 1.0);
+}
+"""
+
+AXES_FRAGMENT_SHADER = """
+#version 330
+in vec3 v_color;
+out vec4 frag_color;
+void main() {
+    frag_color = vec4(v_color, 1.0);
+}
+"""
+
+# GPU vertex record: positions as int16 (moderngl has no normalized int16 attribute
+# format, so the shader scales them back with position_scale), padded to keep the float
+# normal and color 4-byte aligned - 32 bytes per vertex instead of 36
+MESH_VERTEX_DTYPE = np.dtype([
+    ('position', 'i2', 3),
+    ('pad', 'i2'),
+    ('normal', 'f4', 3),
+    ('color', 'f4', 3),
+]) if NUMPY_AVAILABLE else None
+MESH_VERTEX_FORMAT = '3i2 2x 3f 3f'
+
+# Mesh color when the file carries no vertex colors (light gray)
+DEFAULT_MESH_COLOR = (0.7, 0.7, 0.8)
+
+# Reference axes as interleaved (x, y, z, r, g, b) line endpoints: X red, Y green, Z blue
+AXES_VERTICES = (
+    (0.0, 0.0, 0.0, 1.0, 0.0, 0.0), (2.0, 0.0, 0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 0.0, 1.0, 0.0), (0.0, 2.0, 0.0, 0.0, 1.0, 0.0),
+    (0.0, 0.0, 0.0, 0.0, 0.0, 1.0), (0.0, 0.0, 2.0, 0.0, 0.0, 1.0),
+)
+
+
+def _perspective(fovy: float, aspect: float, near: float, far: float):
+    """Projection matrix equivalent to gluPerspective (row-major, column vectors)."""
+    f = 1.0 / np.tan(np.radians(fovy) / 2.0)
+    return np.array([
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (far + near) / (near - far), 2.0 * far * near / (near - far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ], dtype='f4')
+
+
+def _translation(x: float, y: float, z: float):
+    """Translation matrix equivalent to glTranslatef."""
+    m = np.identity(4, dtype='f4')
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def _rotation(angle: float, axis: int):
+    """Rotation by ``angle`` degrees about the x (0) or y (1) axis, as glRotatef."""
+    c, s = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+    m = np.identity(4, dtype='f4')
+    if axis == 0:
+        m[1:3, 1:3] = ((c, -s), (s, c))
+    else:
+        m[0, 0], m[0, 2], m[2, 0], m[2, 2] = c, s, -s, c
+    return m
+
 
 class WebViewCanvas(ctk.CTkFrame):
     """
@@ -63,6 +190,21 @@ class WebViewCanvas(ctk.CTkFrame):
         self.mesh = None
         self.display_list = None
         
+        # ModernGL resources (created once the GL context exists)
+        self.ctx = None
+        self.program = None
+        self.vbo = None
+        self.ibo = None
+        self.vao = None
+        self.mesh_uploaded = False  # False until the current mesh is on the GPU
+        self.mesh_corners = None  # (8, 4) bounding box corners used to skip off-screen meshes
+        self.mesh_bounds = None  # (mins, maxs, max_size) of the centered mesh, measured once at load
+        self.position_scale = 1.0  # Undoes the int16 position quantization in the shader
+        self.axes_program = None
+        self.axes_vbo = None
+        self.axes_vao = None
+        self.axes_list = None  # Display list used when ModernGL is unavailable
+        
         # Camera
         self.camera_rotation_x = 0.0
         self.camera_rotation_y = 0.0
@@ -70,11 +212,25 @@ class WebViewCanvas(ctk.CTkFrame):
         self.camera_pan_x = 0.0
         self.camera_pan_y = 0.0
         
+        # Camera matrices (row-major, column vectors), rebuilt only when the camera or
+        # viewport changes; see _update_matrices
+        self.aspect = 1.0
+        self.projection = None
+        self.view = None
+        self.mvp = None
+        
         # Mouse state
         self.mouse_down = False
         self.last_mouse_pos = [0, 0]
         self.wireframe = False
         
+        # On-demand rendering: frames are only drawn after something changed
+        self._dirty = True
+        self._render_pending = None  # after() id of the scheduled frame
+        
+        # Level of detail: 1 decimates meshes above DECIMATION_FACE_LIMIT at load, 0 keeps full detail
+        self.lod_level = 1
+        
         # Check what's available and create appropriate viewer
         if OPENGL_AVAILABLE and NUMPY_AVAILABLE and TRIMESH_AVAILABLE:
             # Libraries are available, but OpenGL.tkinter doesn't exist
@@ -190,12 +346,60 @@ class WebViewCanvas(ctk.CTkFrame):
         # Background color
         glClearColor(0.1, 0.1, 0.1, 1.0)
         
+        if MODERNGL_AVAILABLE:
+            try:
+                # Attach to the canvas' context rather than creating a new one
+                self.ctx = moderngl.create_context()
+                self.program = self.ctx.program(
+                    vertex_shader=MESH_VERTEX_SHADER,
+                    fragment_shader=MESH_FRAGMENT_SHADER
+                )
+                
+                # The axes never change, so they are uploaded once here
+                self.axes_program = self.ctx.program(
+                    vertex_shader=AXES_VERTEX_SHADER,
+                    fragment_shader=AXES_FRAGMENT_SHADER
+                )
+                self.axes_vbo = self.ctx.buffer(np.array(AXES_VERTICES, dtype='f4').tobytes())
+                self.axes_vao = self.ctx.vertex_array(
+                    self.axes_program,
+                    [(self.axes_vbo, '3f 3f', 'in_pos', 'in_color')]
+                )
+            except Exception as e:
+                print(f"ModernGL unavailable, using immediate mode: {e}")
+                self.ctx = None
+                self.program = None
+                self.axes_program = None
+                self.axes_vbo = None
+                self.axes_vao = None
+        
+        if self.ctx is None:
+            # Record the axes once so frames replay them with a single call
+            self.axes_list = glGenLists(1)
+            glNewList(self.axes_list, GL_COMPILE)
+            glBegin(GL_LINES)
+            for x, y, z, r, g, b in AXES_VERTICES:
+                glColor3f(r, g, b)
+                glVertex3f(x, y, z)
+            glEnd()
+            glEndList()
+        
         self.gl_canvas.releasecurrent()
     
+    def _request_redraw(self):
+        """Mark the view dirty and schedule one frame; bursts of events share it."""
+        self._dirty = True
+        if self._render_pending is None:
+            self._render_pending = self.after(16, self._render)  # Caps redraws at ~60 FPS
+    
     def _render(self):
-        """Render loop."""
+        """Draw one frame if the view changed since the last one."""
+        self._render_pending = None
         if not hasattr(self, 'gl_canvas') or self.gl_canvas is None:
             return
+        if not self._dirty:
+            return
+        self._dirty = False
         
         try:
             self.gl_canvas.makecurrent()
@@ -208,20 +412,19 @@ class WebViewCanvas(ctk.CTkFrame):
                 
                 glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
                 
-                glMatrixMode(GL_PROJECTION)
-                glLoadIdentity()
-                gluPerspective(45.0, width / height, 0.1, 1000.0)
+                if self.mvp is None or width / height != self.aspect:
+                    self.aspect = width / height
+                    self._update_matrices()
                 
-                glMatrixMode(GL_MODELVIEW)
-                glLoadIdentity()
+                if self.ctx is None:
+                    # Fixed-function fallback still draws through the matrix stack
+                    glMatrixMode(GL_PROJECTION)
+                    glLoadMatrixf(np.ascontiguousarray(self.projection.T))
+                    glMatrixMode(GL_MODELVIEW)
+                    glLoadMatrixf(np.ascontiguousarray(self.view.T))
                 
-                # Camera position
-                glTranslatef(self.camera_pan_x, self.camera_pan_y, -self.camera_distance)
-                glRotatef(self.camera_rotation_x, 1.0, 0.0, 0.0)
-                glRotatef(self.camera_rotation_y, 0.0, 1.0, 0.0)
-                
-                # Draw model if loaded
-                if self.mesh is not None:
+                # Draw model if loaded and at least partly in view
+                if self.mesh is not None and self._mesh_in_view():
                     self._draw_mesh()
                 
                 # Draw axes for reference
@@ -232,9 +435,16 @@ class WebViewCanvas(ctk.CTkFrame):
             
         except Exception as e:
             print(f"Render error: {e}")
-        
-        # Schedule next render
-        self.after(16, self._render)  # ~60 FPS
+    
+    def _update_matrices(self):
+        """Rebuild the camera matrices from the current camera state and aspect ratio."""
+        self.projection = _perspective(45.0, self.aspect, 0.1, 1000.0)
+        self.view = (
+            _translation(self.camera_pan_x, self.camera_pan_y, -self.camera_distance)
+            @ _rotation(self.camera_rotation_x, 0)
+            @ _rotation(self.camera_rotation_y, 1)
+        )
+        self.mvp = self.projection @ self.view
     
     def _draw_mesh(self):
         """Draw the loaded mesh."""
@@ -249,44 +459,152 @@ class WebViewCanvas(ctk.CTkFrame):
             glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
             glEnable(GL_LIGHTING)
         
-        # Draw mesh
-        vertices = self.mesh.vertices
-        faces = self.mesh.faces
-        
-        glColor3f(0.7, 0.7, 0.8)  # Light gray
+        if self.ctx is not None:
+            if not self.mesh_uploaded:
+                self._upload_mesh()
+            
+            mvp, normal_matrix = self._current_matrices()
+            self.program['mvp'].write(mvp)
+            self.program['normal_matrix'].write(normal_matrix)
+            self.program['position_scale'].value = self.position_scale
+            self.program['lit'].value = not self.wireframe
+            
+            self.vao.render(moderngl.TRIANGLES)
+            # Hand the pipeline back to fixed function for the axes
+            glUseProgram(0)
+            glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+            return
         
-        glBegin(GL_TRIANGLES)
-        for face in faces:
-            for vertex_idx in face:
-                if vertex_idx < len(vertices):
-                    vertex = vertices[vertex_idx]
-                    glVertex3f(vertex[0], vertex[1], vertex[2])
-        glEnd()
+        # Without ModernGL, replay the triangles from a display list compiled once
+        if not self.mesh_uploaded:
+            self._compile_display_list()
+        glCallList(self.display_list)
         
         # Reset polygon mode
         glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
     
+    def _mesh_in_view(self) -> bool:
+        """Conservative frustum test of the mesh bounding box against the current camera."""
+        if self.mesh_corners is None:
+            return True
+        
+        # Row-vector corners times the transposed MVP give clip coordinates
+        clip = self.mesh_corners @ self.mvp.T
+        x, y, z, w = clip[:, 0], clip[:, 1], clip[:, 2], clip[:, 3]
+        
+        # Culled only when every corner is outside the same clip plane; a box that
+        # straddles the frustum (or surrounds the camera) is always drawn
+        for outside in (x > w, x < -w, y > w, y < -w, z > w, z < -w):
+            if outside.all():
+                return False
+        return True
+    
+    def _current_matrices(self):
+        """MVP and normal matrix as column-major bytes for the shader uniforms."""
+        mvp = np.ascontiguousarray(self.mvp.T).tobytes()
+        # The camera only rotates and translates, so its rotation block transforms normals
+        normal_matrix = np.ascontiguousarray(self.view[:3, :3].T).tobytes()
+        return mvp, normal_matrix
+    
+    def _upload_mesh(self):
+        """Upload the current mesh to the GPU once; called with the GL context current."""
+        self._release_mesh_buffers()
+        
+        # Shared vertices are uploaded once and referenced by the face indices,
+        # so each vertex is transformed once instead of once per face corner.
+        # Position, normal and color of each vertex sit side by side in one buffer,
+        # so the vertex shader fetches a single record per vertex.
+        # Normals are trimesh's smooth per-vertex normals, computed once here.
+        vertices = np.asarray(self.mesh.vertices)
+        
+        # The mesh is centered, so positions fit in +/-scale; quantize them to int16.
+        # A 10 m model still resolves to ~0.3 mm, well below what the view shows.
+        scale = float(np.abs(vertices).max()) if len(vertices) else 0.0
+        if scale <= 0.0:
+            scale = 1.0
+        # The shader receives the raw int16 values; position_scale maps them back
+        self.position_scale = scale / 32767.0
+        
+        interleaved = np.zeros(len(vertices), dtype=MESH_VERTEX_DTYPE)
+        interleaved['position'] = np.round(vertices / scale * 32767.0)
+        interleaved['normal'] = self.mesh.vertex_normals
+        interleaved['color'] = self._vertex_colors()
+        indices = np.ascontiguousarray(self.mesh.faces, dtype='u4')
+        self.vbo = self.ctx.buffer(interleaved.tobytes())
+        self.ibo = self.ctx.buffer(indices.tobytes())
+        self.vao = self.ctx.vertex_array(
+            self.program,
+            [(self.vbo, MESH_VERTEX_FORMAT, 'in_vert', 'in_normal', 'in_color')],
+            index_buffer=self.ibo,
+            index_element_size=4
+        )
+        self.mesh_uploaded = True
+    
+    def _compile_display_list(self):
+        """Record the mesh into a display list once; called with the GL context current."""
+        self._release_mesh_buffers()
+        
+        # Hand the whole mesh to GL as client-side arrays instead of per-vertex calls
+        vertices = np.ascontiguousarray(self.mesh.vertices, dtype=np.float32)
+        # Without normals every vertex uses the default (0, 0, 1) and lighting is flat
+        normals = np.ascontiguousarray(self.mesh.vertex_normals, dtype=np.float32)
+        colors = self._vertex_colors()
+        faces = np.asarray(self.mesh.faces)
+        # Drop faces pointing past the vertex array rather than reading out of bounds
+        faces = faces[(faces < len(vertices)).all(axis=1)]
+        indices = np.ascontiguousarray(faces, dtype=np.uint32)
+        
+        self.display_list = glGenLists(1)
+        glNewList(self.display_list, GL_COMPILE)
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertices)
+        glNormalPointer(GL_FLOAT, 0, normals)
+        glColorPointer(3, GL_FLOAT, 0, colors)
+        glDrawElements(GL_TRIANGLES, indices.size, GL_UNSIGNED_INT, indices)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glEndList()
+        self.mesh_uploaded = True
+    
+    def _vertex_colors(self):
+        """Per-vertex RGB in 0..1: the file's vertex colors if it has them, else the default gray."""
+        visual = getattr(self.mesh, 'visual', None)
+        if getattr(visual, 'kind', None) == 'vertex':
+            return np.asarray(visual.vertex_colors[:, :3], dtype=np.float32) / 255.0
+        colors = np.empty((len(self.mesh.vertices), 3), dtype=np.float32)
+        colors[:] = DEFAULT_MESH_COLOR
+        return colors
+    
+    def _release_mesh_buffers(self):
+        """Free the GPU buffers or display list of the previously uploaded mesh."""
+        if self.display_list is not None:
+            glDeleteLists(self.display_list, 1)
+            self.display_list = None
+        if self.vao is not None:
+            self.vao.release()
+            self.vao = None
+        if self.vbo is not None:
+            self.vbo.release()
+            self.vbo = None
+        if self.ibo is not None:
+            self.ibo.release()
+            self.ibo = None
+    
     def _draw_axes(self):
         """Draw coordinate axes for reference."""
         glDisable(GL_LIGHTING)
         glLineWidth(2.0)
         
-        glBegin(GL_LINES)
-        # X axis - red
-        glColor3f(1.0, 0.0, 0.0)
-        glVertex3f(0.0, 0.0, 0.0)
-        glVertex3f(2.0, 0.0, 0.0)
-        
-        # Y axis - green
-        glColor3f(0.0, 1.0, 0.0)
-        glVertex3f(0.0, 0.0, 0.0)
-        glVertex3f(0.0, 2.0, 0.0)
-        
-        # Z axis - blue
-        glColor3f(0.0, 0.0, 1.0)
-        glVertex3f(0.0, 0.0, 0.0)
-        glVertex3f(0.0, 0.0, 2.0)
-        glEnd()
+        if self.axes_vao is not None:
+            self.axes_program['mvp'].write(self._current_matrices()[0])
+            self.axes_vao.render(moderngl.LINES)
+            glUseProgram(0)
+        elif self.axes_list is not None:
+            glCallList(self.axes_list)
         
         glEnable(GL_LIGHTING)
     
@@ -308,6 +626,8 @@ class WebViewCanvas(ctk.CTkFrame):
             self.camera_rotation_x = max(-90, min(90, self.camera_rotation_x))
             
             self.last_mouse_pos = [event.x, event.y]
+            self._update_matrices()
+            self._request_redraw()
     
     def _on_mouse_up(self, event):
         """Handle mouse button up."""
@@ -322,10 +642,15 @@ class WebViewCanvas(ctk.CTkFrame):
         
         self.camera_distance += delta * 0.1
         self.camera_distance = max(1.0, min(100.0, self.camera_distance))
+        self._update_matrices()
+        self._request_redraw()
     
     def _on_resize(self, event):
         """Handle canvas resize."""
-        pass
+        if event.width > 0 and event.height > 0:
+            self.aspect = event.width / event.height
+            self._update_matrices()
+        self._request_redraw()
     
     def load_gltf(self, file_path: str):
         """Load GLTF file."""
@@ -342,30 +667,46 @@ class WebViewCanvas(ctk.CTkFrame):
         
         try:
             import trimesh
-            scene = trimesh.load(file_path)
+            # process=False skips trimesh's vertex merging and validation on load
+            scene = trimesh.load(file_path, process=False)
             
             # Get mesh data
             if isinstance(scene, trimesh.Scene):
-                self.mesh = scene.dump(concatenate=True)
+                self.mesh = self._single_mesh(scene) or scene.dump(concatenate=True)
             else:
                 self.mesh = scene
             
             if self.mesh is not None:
-                # Calculate bounding box and center
-                bounds = self.mesh.bounds
-                center = self.mesh.centroid
+                # Statistics describe the file, not the decimated preview
+                vertices = len(self.mesh.vertices)
+                faces = len(self.mesh.faces)
                 
-                # Center the mesh
+                if self.lod_level > 0 and faces > DECIMATION_FACE_LIMIT:
+                    self.mesh = self._decimate(self.mesh, DECIMATION_FACE_LIMIT)
+                
+                # Bounding box in one min/max pass over the raw vertex array; its center
+                # avoids trimesh's area-weighted centroid, which walks every face
+                verts = np.asarray(self.mesh.vertices)
+                mins = verts.min(axis=0)
+                maxs = verts.max(axis=0)
+                center = 0.5 * (mins + maxs)
+                
+                # Center the mesh in place (through the tracked array so trimesh's
+                # cached bounds are invalidated)
                 self.mesh.vertices -= center
+                # New geometry - upload on the next frame
+                self.mesh_uploaded = False
+                
+                # Homogeneous corners of the centered bounding box for view culling
+                half = 0.5 * (maxs - mins)
+                signs = np.array([[sx, sy, sz] for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)])
+                self.mesh_corners = np.hstack([signs * half, np.ones((8, 1))]).astype('f4')
                 
                 # Adjust camera distance based on model size
-                size = bounds[1] - bounds[0]
-                max_size = max(size)
+                max_size = float((maxs - mins).max())
                 self.camera_distance = max_size * 2.0
-                
-                # Calculate statistics
-                vertices = len(self.mesh.vertices)
-                faces = len(self.mesh.faces)
+                self.mesh_bounds = (mins - center, maxs - center, max_size)
+                self._update_matrices()
                 
                 stats = {
                     'vertices': vertices,
@@ -376,6 +717,7 @@ class WebViewCanvas(ctk.CTkFrame):
                 }
                 
                 self.model_stats = stats
+                self._request_redraw()
                 
                 if self.on_model_loaded:
                     self.on_model_loaded(stats)
@@ -393,6 +735,31 @@ class WebViewCanvas(ctk.CTkFrame):
                 self.on_model_error(error_msg)
             return False
     
+    def _single_mesh(self, scene):
+        """Return the scene's only mesh placed in world space, or None if it has several."""
+        nodes = scene.graph.nodes_geometry
+        if len(nodes) != 1:
+            return None
+        transform, geometry_name = scene.graph[nodes[0]]
+        mesh = scene.geometry.get(geometry_name)
+        if not isinstance(mesh, trimesh.Trimesh):
+            return None
+        # Same placement dump() would give, without copying and concatenating arrays
+        if not np.allclose(transform, np.eye(4)):
+            mesh.apply_transform(transform)
+        return mesh
+    
+    def _decimate(self, mesh, face_count: int):
+        """Return a quadric-simplified copy of ``mesh``, or ``mesh`` itself if that fails."""
+        try:
+            simplified = mesh.simplify_quadric_decimation(face_count=face_count)
+            print(f"Decimated mesh from {len(mesh.faces)} to {len(simplified.faces)} faces for display")
+            return simplified
+        except Exception as e:
+            # Needs a simplification backend (fast-simplification / open3d)
+            print(f"Mesh decimation unavailable, drawing full mesh: {e}")
+            return mesh
+    
     def reset_view(self):
         """Reset camera to default."""
         self.camera_rotation_x = 0.0
@@ -401,21 +768,49 @@ class WebViewCanvas(ctk.CTkFrame):
         self.camera_pan_x = 0.0
         self.camera_pan_y = 0.0
         
-        if self.mesh is not None:
-            # Recalculate distance based on model
-            bounds = self.mesh.bounds
-            size = bounds[1] - bounds[0]
-            max_size = max(size)
-            self.camera_distance = max_size * 2.0
+        if self.mesh_bounds is not None:
+            # Distance based on the model size measured at load
+            self.camera_distance = self.mesh_bounds[2] * 2.0
+        
+        self._update_matrices()
+        self._request_redraw()
     
     def toggle_wireframe(self):
         """Toggle wireframe mode."""
         self.wireframe = not self.wireframe
+        self._request_redraw()
     
     def clear(self):
         """Clear current model."""
+        if getattr(self, 'gl_canvas', None) is not None:
+            # GPU objects can only be freed while the context is current
+            self.gl_canvas.makecurrent()
+            self._release_mesh_buffers()
+            self.gl_canvas.releasecurrent()
         self.mesh = None
+        self.mesh_uploaded = False
+        self.mesh_corners = None
+        self.mesh_bounds = None
         self.current_file = None
         self.model_stats = None
+        self._request_redraw()
+    
+    def destroy(self):
+        """Free every GL object, including the ModernGL context, before the widget goes away."""
+        if self._render_pending is not None:
+            self.after_cancel(self._render_pending)
+            self._render_pending = None
+        if getattr(self, 'gl_canvas', None) is not None:
+            self.gl_canvas.makecurrent()
+            self._release_mesh_buffers()
+            for resource in (self.axes_vao, self.axes_vbo, self.axes_program, self.program, self.ctx):
+                if resource is not None:
+                    resource.release()
+            if self.axes_list is not None:
+                glDeleteLists(self.axes_list, 1)
+            self.gl_canvas.releasecurrent()
+        self.axes_vao = self.axes_vbo = self.axes_program = self.program = self.ctx = None
+        self.axes_list = None
+        super().destroy()
 
 
@@ -13,6 +13,7 @@ import threading
 import http.server
 import socketserver
 import json
+from urllib.parse import unquote
 
 try:
     import webview
@@ -20,6 +21,48 @@ try:
 except ImportError:
     WEBVIEW_AVAILABLE = False
 
+# How long a queued load waits for the page's onViewerReady before trying anyway
+VIEWER_READY_TIMEOUT = 5.0
+
+# Vendored three.js / draco builds only change with an app update
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Vendored three.js builds (draco_* decoders and .wasm are matched by pattern)
+VENDORED_THREE_FILES = frozenset({'three.module.js', 'three.min.js'})
+
+# Content types for what the viewer serves, so requests skip the mimetypes lookup
+VIEWER_MIME_TYPES = {
+    '.html': 'text/html',
+    '.js': 'application/javascript',
+    '.css': 'text/css',
+    '.wasm': 'application/wasm',
+    '.json': 'application/json',
+    '.gltf': 'model/gltf+json',
+    '.glb': 'model/gltf-binary',
+    '.bin': 'application/octet-stream',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+}
+
+
+def _cache_control(path: str) -> str:
+    """Cache policy for a viewer file, by URL path."""
+    name = path.rpartition('/')[2]
+    if name in VENDORED_THREE_FILES or name.startswith('draco_') or name.endswith('.wasm'):
+        return STATIC_CACHE_CONTROL
+    # index.html and the viewer's own (unhashed) scripts, including the three-*.js
+    # wrappers, revalidate through Last-Modified
+    return 'no-cache'
+
+
+class ViewerHTTPServer(http.server.ThreadingHTTPServer):
+    """Serves each viewer request on its own thread so the page's parallel fetches don't queue."""
+    
+    # Set before bind so a quick restart can reuse the port
+    allow_reuse_address = True
+    daemon_threads = True
+
 
 class WebViewCanvas(ctk.CTkFrame):
     """
@@ -50,6 +93,11 @@ class WebViewCanvas(ctk.CTkFrame):
         self.current_file: Optional[str] = None
         self.model_stats: Optional[dict] = None
         self.webview_window: Optional[webview.Window] = None
+        self.viewer_ready_event = threading.Event()  # Set by the page via WebViewAPI.onViewerReady
+        # Latest model URL waiting for the page; only one waiter thread sends it
+        self._pending_url: Optional[str] = None
+        self._load_waiter: Optional[threading.Thread] = None
+        self._load_lock = threading.Lock()
         self.http_server: Optional[socketserver.TCPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self.server_port = 8765
@@ -69,28 +117,66 @@ class WebViewCanvas(ctk.CTkFrame):
     
     def _start_local_server(self):
         """Start a local HTTP server to serve viewer files."""
+        # One server for the widget's lifetime; clear() and load_gltf() reuse it
+        if self.http_server:
+            return
+        
         try:
+            # Resolve every viewer file once: URL path -> filesystem path
+            path_cache = {
+                file.relative_to(self.viewer_dir).as_posix(): str(file)
+                for file in self.viewer_dir.rglob('*') if file.is_file()
+            }
+            if 'index.html' in path_cache:
+                path_cache[''] = path_cache['index.html']
+            
             class ViewerHandler(http.server.SimpleHTTPRequestHandler):
-                def __init__(self, *args, viewer_dir=None, **kwargs):
+                # Keep-alive: the page's scripts reuse one connection instead of reconnecting
+                protocol_version = 'HTTP/1.1'
+                
+                def __init__(self, *args, viewer_dir=None, path_cache=None, **kwargs):
                     self.viewer_dir = viewer_dir
-                    super().__init__(*args, **kwargs)
+                    self.path_cache = path_cache or {}
+                    super().__init__(*args, directory=str(viewer_dir), **kwargs)
+                
+                def send_response(self, code, message=None):
+                    """Let the webview cache vendored libraries; everything else revalidates."""
+                    super().send_response(code, message)
+                    if code == 200:
+                        self.send_header('Cache-Control', _cache_control(self.path.partition('?')[0]))
+                
+                def copyfile(self, source, outputfile):
+                    """Send file bodies with sendfile (socket.sendfile falls back to send() on Windows)."""
+                    outputfile.flush()
+                    self.connection.sendfile(source)
                 
                 def translate_path(self, path):
                     """Translate URL path to file path."""
-                    path = path.lstrip('/')
-                    if not path or path == '/':
+                    path = path.partition('?')[0].lstrip('/')
+                    if '%' in path:
+                        path = unquote(path)
+                    cached = self.path_cache.get(path)
+                    if cached is not None:
+                        return cached
+                    if not path:
                         path = 'index.html'
                     return str(self.viewer_dir / path)
                 
+                def guess_type(self, path):
+                    """Look up the content type by extension, falling back to mimetypes."""
+                    content_type = VIEWER_MIME_TYPES.get(os.path.splitext(path)[1].lower())
+                    return content_type or super().guess_type(path)
+                
                 def log_message(self, format, *args):
                     """Suppress server logs."""
                     pass
             
             # Create custom handler with viewer directory
-            handler = lambda *args, **kwargs: ViewerHandler(*args, viewer_dir=self.viewer_dir, **kwargs)
+            handler = lambda *args, **kwargs: ViewerHandler(
+                *args, viewer_dir=self.viewer_dir, path_cache=path_cache, **kwargs
+            )
             
-            self.http_server = socketserver.TCPServer(("", self.server_port), handler)
-            self.http_server.allow_reuse_address = True
+            self.http_server = ViewerHTTPServer(("", self.server_port), handler)
             
             def serve():
                 try:
@@ -117,13 +203,6 @@ class WebViewCanvas(ctk.CTkFrame):
         self.current_file = file_path
         
         try:
-            # Close existing window if any
-            if self.webview_window:
-                try:
-                    self.webview_window.destroy()
-                except:
-                    pass
-            
             # Prepare file URL
             if self.server_port:
                 # Use local server
@@ -134,8 +213,18 @@ class WebViewCanvas(ctk.CTkFrame):
                 viewer_url = self.html_path.absolute().as_uri()
                 file_url = Path(file_path).absolute().as_uri()
             
+            if self.webview_window:
+                # Reuse the open window: swapping the model keeps three.js and its shaders loaded
+                try:
+                    self.webview_window.set_title(f"GLTF Viewer - {os.path.basename(file_path)}")
+                except Exception:
+                    pass
+                self._load_file_in_viewer(file_url)
+                return True
+            
             # Create API
             api = WebViewAPI(self)
+            self.viewer_ready_event.clear()
             
             # Create and show webview window
             self.webview_window = webview.create_window(
@@ -146,6 +235,11 @@ class WebViewCanvas(ctk.CTkFrame):
                 resizable=True,
                 js_api=api
             )
+            try:
+                self.webview_window.events.closed += self._on_window_closed
+            except AttributeError:
+                # Older pywebview without window events - the window is simply reused
+                pass
             
             # Start webview - must be on main thread
             # We'll use Tkinter's after() to schedule it on main thread
@@ -166,18 +260,14 @@ class WebViewCanvas(ctk.CTkFrame):
                     # But we try it as workaround
                     t = threading.Thread(target=run_webview, daemon=True)
                     t.start()
-                    
-                    # Give it time to start
-                    import time
-                    time.sleep(1.5)
                 except Exception as e:
                     print(f"Error scheduling webview: {e}")
             
             # Schedule to run on Tkinter's main thread
             self.after(100, start_on_main)
             
-            # Wait a moment then load the file
-            threading.Timer(1.0, lambda: self._load_file_in_viewer(file_url)).start()
+            # Sent once the page reports it is ready
+            self._load_file_in_viewer(file_url)
             
             return True
         except Exception as e:
@@ -185,54 +275,77 @@ class WebViewCanvas(ctk.CTkFrame):
             return False
     
     def _load_file_in_viewer(self, file_url: str):
-        """Load file in viewer after window is ready."""
+        """Load file in viewer, waiting off the Tk thread if the page is not ready yet."""
+        with self._load_lock:
+            if self.viewer_ready_event.is_set():
+                # Supersedes anything still queued; sent under the lock so a waiter
+                # can't deliver an older model after this one
+                self._pending_url = None
+                self._send_load(file_url)
+                return
+            # Loads issued before the page is ready collapse into the latest one
+            self._pending_url = file_url
+            if self._load_waiter is None:
+                self._load_waiter = threading.Thread(target=self._send_load_when_ready, daemon=True)
+                self._load_waiter.start()
+    
+    def _send_load_when_ready(self):
+        """Block until the page signals readiness, then send the latest pending load."""
+        if not self.viewer_ready_event.wait(timeout=VIEWER_READY_TIMEOUT):
+            print("Viewer did not report ready in time, sending model anyway")
+        with self._load_lock:
+            file_url = self._pending_url
+            self._pending_url = None
+            self._load_waiter = None
+            if file_url:
+                self._send_load(file_url)
+    
+    def _send_load(self, file_url: str):
+        """Ask the page to load the model."""
+        try:
+            # Queued on the page's ready promise so a load issued during startup isn't lost
+            self._call_viewer('load', file_url)
+        except Exception as e:
+            print(f"Error loading file in viewer: {e}")
+    
+    def _call_viewer(self, action: str, *args):
+        """Run one command from the page's window.__v table; arguments are JSON-encoded."""
         if self.webview_window:
-            try:
-                js = f"if (typeof viewer !== 'undefined' && viewer) viewer.loadGLTF('{file_url}');"
-                self.webview_window.evaluate_js(js)
-            except Exception as e:
-                print(f"Error loading file in viewer: {e}")
+            js_args = ', '.join(json.dumps(arg) for arg in args)
+            # void: don't ship the command's return value (e.g. a promise) back over the bridge
+            self.webview_window.evaluate_js(f"window.__v && void window.__v.{action}({js_args});")
+    
+    def _on_window_closed(self):
+        """Forget the window once the user closes it so the next load opens a new one."""
+        self.webview_window = None
+        self.viewer_ready_event.clear()
     
     def reset_view(self):
         """Reset camera view."""
-        if self.webview_window:
-            try:
-                self.webview_window.evaluate_js("if (typeof viewer !== 'undefined' && viewer) viewer.resetView();")
-            except:
-                pass
+        try:
+            self._call_viewer('reset')
+        except:
+            pass
     
     def toggle_wireframe(self):
         """Toggle wireframe mode."""
-        if self.webview_window:
-            try:
-                self.webview_window.evaluate_js("if (typeof viewer !== 'undefined' && viewer) viewer.toggleWireframe();")
-            except:
-                pass
+        try:
+            self._call_viewer('wire')
+        except:
+            pass
     
     def clear(self):
         """Clear current model and browser cache."""
-        if self.webview_window:
-            try:
-                # Clear viewer
-                self.webview_window.evaluate_js("if (typeof viewer !== 'undefined' && viewer) viewer.clear();")
-                
-                # Clear browser localStorage (material colors, etc.)
-                clear_cache_js = """
-                try {
-                    localStorage.removeItem('materialManager_colors');
-                    localStorage.removeItem('materialManager_partColors');
-                    console.log('Browser cache cleared');
-                } catch (e) {
-                    console.warn('Failed to clear browser cache:', e);
-                }
-                """
-                self.webview_window.evaluate_js(clear_cache_js)
-            except:
-                pass
-            # Don't destroy window, just clear the content
-            # self.webview_window.destroy()
-            # self.webview_window = None
+        try:
+            # Clears the viewer and its localStorage (material colors, etc.) in one call.
+            # The window itself is kept, only its content is cleared.
+            self._call_viewer('clear')
+        except:
+            pass
         
+        with self._load_lock:
+            # A load still waiting for the page would bring the model back
+            self._pending_url = None
         self.current_file = None
         self.model_stats = None
     
@@ -254,6 +367,9 @@ class WebViewAPI:
     def __init__(self, canvas: WebViewCanvas):
         self.canvas = canvas
     
+    def onViewerReady(self):
+        self.canvas.viewer_ready_event.set()
+    
     def onModelLoaded(self, stats: dict):
         self.canvas.on_model_loaded_callback(stats)
     
@@ -8,20 +8,129 @@ import sys
 import customtkinter as ctk
 from typing import Optional, Callable
 from pathlib import Path
+from urllib.parse import quote
 import threading
 import http.server
 import socketserver
+import socket
 import webbrowser
 import time
+import hashlib
+import gzip
+import re
 from tkinter import messagebox
 
 
+# Get viewer directory - handle PyInstaller bundle
+if getattr(sys, 'frozen', False):
+    # Running as compiled exe
+    BASE_PATH = Path(sys._MEIPASS)
+else:
+    # Running as script
+    BASE_PATH = Path(__file__).parent.parent
+
+VIEWER_DIR = BASE_PATH / "viewer"
+HTML_PATH = VIEWER_DIR / "index.html"
+
+# Single-range 'Range: bytes=first-last' header (either end may be omitted)
+RANGE_PATTERN = re.compile(r'bytes=(\d*)-(\d*)$')
+
+# Text assets compressed once at server start; binary formats (.wasm, .glb, images)
+# gain little and are sent as-is
+GZIP_SUFFIXES = ('.js', '.css', '.html', '.gltf', '.svg', '.json')
+
+# Vendored three.js builds (draco_* decoders and .wasm are matched by pattern)
+VENDORED_THREE_FILES = frozenset({'three.module.js', 'three.min.js'})
+
+# Content types by extension; anything else is sent as octet-stream
+MIME_TYPES = {
+    '.html': 'text/html',
+    '.js': 'application/javascript',
+    '.css': 'text/css',
+    '.wasm': 'application/wasm',
+    '.json': 'application/json',
+    '.glb': 'model/gltf-binary',
+    '.gltf': 'model/gltf+json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+}
+
+# First port tried by the viewer server; the next nine are fallbacks
+DEFAULT_SERVER_PORT = 8765
+
+# Socket send buffer, so sendfile can drain more pages per call
+SOCKET_SEND_BUFFER = 1 << 20
+
+
+def _content_type(path: str) -> str:
+    """Content type for a viewer file, by extension."""
+    return MIME_TYPES.get(os.path.splitext(path)[1].lower(), 'application/octet-stream')
+
+
+def _cache_control(path: str) -> str:
+    """Cache policy for a viewer file."""
+    if path == 'index.html':
+        return 'no-cache, no-store'
+    name = path.rpartition('/')[2]
+    # Vendored three.js / draco builds only change with an app update. Listed by name:
+    # the project's own three-*.js wrappers must revalidate like the other viewer scripts.
+    if (path.startswith('assets/') or name in VENDORED_THREE_FILES
+            or name.startswith('draco_') or name.endswith('.wasm')):
+        return 'public, max-age=31536000, immutable'
+    # The viewer's own scripts revalidate cheaply through their ETag
+    return 'no-cache'
+
+
+def _header_block(protocol_version: str, content_type: str, length: int, etag: str,
+                  cache_control: str, encoding: Optional[str] = None, vary: bool = False) -> bytes:
+    """Status line and headers of a full 200 response, encoded for a single write."""
+    lines = [
+        f'{protocol_version} 200 OK',
+        f'Content-type: {content_type}',
+        f'Content-Length: {length}',
+    ]
+    if encoding:
+        lines.append(f'Content-Encoding: {encoding}')
+    else:
+        lines.append('Accept-Ranges: bytes')
+    if encoding or vary:
+        lines.append('Vary: Accept-Encoding')
+    lines += [
+        f'ETag: {etag}',
+        f'Cache-Control: {cache_control}',
+        'Access-Control-Allow-Origin: *',
+    ]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+class ViewerHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded server for the viewer files, tuned for small headers and large bodies."""
+    
+    # Class attributes, so they are in effect when __init__ binds the socket
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def server_bind(self):
+        super().server_bind()
+        # Accepted connections inherit these from the listening socket on most platforms
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
+
+
 class WebViewCanvas(ctk.CTkFrame):
     """
     Canvas widget that shows instructions for embedded viewing.
     Uses a local server and can embed browser view instructions.
     """
     
+    # One server per process, shared by every viewer
+    _server_lock = threading.Lock()
+    http_server: Optional[socketserver.TCPServer] = None
+    server_thread: Optional[threading.Thread] = None
+    server_port: Optional[int] = DEFAULT_SERVER_PORT
+    server_started = False
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color="gray20", **kwargs)
         
@@ -29,26 +138,14 @@ class WebViewCanvas(ctk.CTkFrame):
         self.on_model_loaded: Optional[Callable[[dict]]] = None
         self.on_model_error: Optional[Callable[[str]]] = None
         
-        # Get viewer directory
-        # Get viewer directory - handle PyInstaller bundle
-        import sys
-        if getattr(sys, 'frozen', False):
-            # Running as compiled exe
-            base_path = Path(sys._MEIPASS)
-        else:
-            # Running as script
-            base_path = Path(__file__).parent.parent
-        
-        self.viewer_dir = base_path / "viewer"
-        self.html_path = self.viewer_dir / "index.html"
+        self.viewer_dir = VIEWER_DIR
+        self.html_path = HTML_PATH
         
         # State
         self.current_file: Optional[str] = None
         self.model_stats: Optional[dict] = None
-        self.http_server: Optional[socketserver.TCPServer] = None
-        self.server_thread: Optional[threading.Thread] = None
-        self.server_port = 8765
-        self.server_started = False
+        self._stats_shown = False  # Stats block already appended to the info text
+        self._info_layout = "welcome"  # Which text the info box holds: welcome/model/cleared
         
         # Create embedded view area
         self._create_embedded_view()
@@ -105,86 +202,251 @@ Model information will be displayed in the sidebar."""
         self.status_label.pack(pady=10)
     
     def _start_local_server(self):
-        """Start a local HTTP server to serve viewer files."""
-        if self.server_started:
-            return
-        
+        """Start the local HTTP server shared by all viewers, on first use."""
+        with WebViewCanvas._server_lock:
+            if not self.server_started:
+                self._create_local_server()
+    
+    def _create_local_server(self):
+        """Bind and start the viewer server; the caller holds _server_lock."""
+        cls = WebViewCanvas
         try:
             class ViewerHandler(http.server.SimpleHTTPRequestHandler):
-                def __init__(self, *args, viewer_dir=None, **kwargs):
-                    self.viewer_dir = viewer_dir
-                    super().__init__(*args, **kwargs)
+                # Headers go out immediately instead of waiting on Nagle's algorithm
+                disable_nagle_algorithm = True
+                
+                def setup(self):
+                    super().setup()
+                    self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
                 
                 def do_GET(self):
                     """Handle GET requests."""
                     path = self.path.lstrip('/').split('?')[0]
+                    if path == '':
+                        path = 'index.html'
                     
-                    # Serve index.html
-                    if path == '' or path == 'index.html':
-                        html_file = self.viewer_dir / 'index.html'
-                        if html_file.exists():
-                            content = html_file.read_text(encoding='utf-8')
-                            self.send_response(200)
-                            self.send_header('Content-type', 'text/html')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            self.wfile.write(content.encode())
-                        else:
-                            self.send_response(404)
-                            self.end_headers()
+                    # Files indexed at server start need no stat before the headers
+                    entry = self.server.static_index.get(path)
+                    if entry is not None:
+                        file_path, file_size, mtime_ns, content_type, etag, cache_control, header = entry
+                        gzipped = self.server.gzip_cache.get(path)
+                        use_gzip = gzipped is not None and 'gzip' in self.headers.get('Accept-Encoding', '')
+                        from_memory = use_gzip or (
+                            path == 'index.html' and self.server.index_html_bytes is not None
+                        )
+                        if use_gzip:
+                            body, header = gzipped
+                            # The compressed variant is a different representation
+                            etag = etag[:-1] + '-gz"'
+                        
+                        f = None
+                        if not from_memory:
+                            try:
+                                f = open(file_path, 'rb')
+                            except OSError:
+                                self.send_response(404)
+                                self.end_headers()
+                                return
+                            stat = os.fstat(f.fileno())
+                            if (stat.st_size, stat.st_mtime_ns) != (file_size, mtime_ns):
+                                # Changed since startup: the indexed length and ETag no longer
+                                # describe it, so send it like an unindexed file
+                                with f:
+                                    self._send_file(f, stat.st_size, content_type)
+                                return
+                        
+                        try:
+                            if self.headers.get('If-None-Match') == etag:
+                                self.send_response(304)
+                                self.send_header('ETag', etag)
+                                self.send_header('Cache-Control', cache_control)
+                                if gzipped is not None:
+                                    self.send_header('Vary', 'Accept-Encoding')
+                                self.end_headers()
+                            # Full responses write the status line and headers encoded at startup
+                            elif use_gzip:
+                                self.wfile.write(header + body)
+                            elif from_memory:
+                                # Page navigations are answered from memory
+                                self.wfile.write(header + self.server.index_html_bytes)
+                            elif 'Range' in self.headers:
+                                self._send_file(f, file_size, content_type, etag, cache_control,
+                                                vary=gzipped is not None)
+                            else:
+                                self.wfile.write(header)
+                                self._copy_file(f, 0, file_size)
+                        finally:
+                            if f is not None:
+                                f.close()
+                        return
                     
-                    # Serve other files
+                    # Files added after the server started; '..' must not leave the viewer dir
+                    root = self.server.viewer_root
+                    file_path = (root / path).resolve()
+                    if root in file_path.parents and file_path.is_file():
+                        with open(file_path, 'rb') as f:
+                            self._send_file(f, os.fstat(f.fileno()).st_size, _content_type(path))
                     else:
-                        file_path = self.viewer_dir / path
-                        if file_path.exists() and file_path.is_file():
-                            self.send_response(200)
-                            if path.endswith('.js'):
-                                self.send_header('Content-type', 'application/javascript')
-                            elif path.endswith('.css'):
-                                self.send_header('Content-type', 'text/css')
-                            elif path.endswith('.wasm'):
-                                self.send_header('Content-type', 'application/wasm')
-                            else:
-                                self.send_header('Content-type', 'application/octet-stream')
-                            self.send_header('Access-Control-Allow-Origin', '*')
-                            self.end_headers()
-                            with open(file_path, 'rb') as f:
-                                self.wfile.write(f.read())
+                        self.send_response(404)
+                        self.end_headers()
+                
+                def _send_file(self, f, file_size, content_type, etag=None,
+                               cache_control='no-cache', vary=False):
+                    """Send headers, then the file body (or one requested byte range) without
+                    copying it through Python."""
+                    start, end = 0, file_size - 1
+                    status = 200
+                    
+                    # Single byte ranges only; anything else gets the whole file
+                    match = RANGE_PATTERN.match(self.headers.get('Range', '').strip())
+                    if match and (match.group(1) or match.group(2)):
+                        first, last = match.groups()
+                        if first:
+                            start = int(first)
+                            if last:
+                                end = min(int(last), file_size - 1)
                         else:
-                            self.send_response(404)
+                            # Suffix range: the last N bytes
+                            start = max(file_size - int(last), 0)
+                        if start > end:
+                            self.send_response(416)
+                            self.send_header('Content-Range', f'bytes */{file_size}')
+                            self.send_header('Content-Length', '0')
                             self.end_headers()
+                            return
+                        status = 206
+                    length = end - start + 1
+                    
+                    self.send_response(status)
+                    self.send_header('Content-type', content_type)
+                    self.send_header('Content-Length', str(length))
+                    self.send_header('Accept-Ranges', 'bytes')
+                    if status == 206:
+                        self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+                    if etag:
+                        self.send_header('ETag', etag)
+                    if vary:
+                        self.send_header('Vary', 'Accept-Encoding')
+                    self.send_header('Cache-Control', cache_control)
+                    self.send_header('Access-Control-Allow-Origin', '*')
+                    self.end_headers()
+                    self._copy_file(f, start, length)
+                
+                def _copy_file(self, f, start, length):
+                    """Copy length bytes of an open file, from start, to the socket."""
+                    if hasattr(os, 'sendfile') and sys.platform != 'win32':
+                        # Zero-copy: the kernel moves file pages straight to the socket
+                        self.wfile.flush()
+                        out_fd = self.wfile.fileno()
+                        offset, stop = start, start + length
+                        while offset < stop:
+                            sent = os.sendfile(out_fd, f.fileno(), offset, stop - offset)
+                            if not sent:
+                                break
+                            offset += sent
+                    else:
+                        f.seek(start)
+                        remaining = length
+                        while remaining > 0:
+                            chunk = f.read(min(64 * 1024, remaining))
+                            if not chunk:
+                                break
+                            self.wfile.write(chunk)
+                            remaining -= len(chunk)
                 
                 def log_message(self, format, *args):
                     pass
             
-            handler_factory = lambda *args, **kwargs: ViewerHandler(
-                *args, viewer_dir=self.viewer_dir, **kwargs
-            )
+            static_index, gzip_cache = self._build_static_index(ViewerHandler.protocol_version)
+            try:
+                index_html_bytes = self.html_path.read_bytes()
+            except FileNotFoundError:
+                index_html_bytes = None
+            
+            viewer_root = self.viewer_dir.resolve()
             
-            for port in range(self.server_port, self.server_port + 10):
+            for port in range(DEFAULT_SERVER_PORT, DEFAULT_SERVER_PORT + 10):
                 try:
-                    self.http_server = socketserver.TCPServer(("", port), handler_factory)
-                    self.http_server.allow_reuse_address = True
-                    self.server_port = port
+                    # One thread per connection (daemon threads), so a large download
+                    # doesn't hold up the page's other asset requests. Loopback only:
+                    # the viewer is always opened on this machine
+                    cls.http_server = ViewerHTTPServer(("127.0.0.1", port), ViewerHandler)
+                    # Shared by all handlers through self.server
+                    cls.http_server.static_index = static_index
+                    cls.http_server.gzip_cache = gzip_cache
+                    cls.http_server.index_html_bytes = index_html_bytes
+                    cls.http_server.viewer_root = viewer_root
+                    cls.server_port = port
                     break
                 except OSError:
                     continue
             
-            if self.http_server:
+            if cls.http_server:
                 def serve():
                     try:
-                        self.http_server.serve_forever()
+                        cls.http_server.serve_forever()
                     except:
                         pass
                 
-                self.server_thread = threading.Thread(target=serve, daemon=True)
-                self.server_thread.start()
-                self.server_started = True
-                time.sleep(0.5)
+                cls.server_thread = threading.Thread(target=serve, daemon=True)
+                cls.server_thread.start()
+                cls.server_started = True
+                
+                # The socket is listening once the server is constructed; confirm it
+                # accepts instead of sleeping a fixed half second
+                deadline = time.monotonic() + 1.0
+                while time.monotonic() < deadline:
+                    try:
+                        socket.create_connection(('127.0.0.1', cls.server_port), timeout=0.05).close()
+                        break
+                    except OSError:
+                        time.sleep(0.005)
                 
         except Exception as e:
             print(f"Failed to start server: {e}")
-            self.server_port = None
+            cls.server_port = None
+    
+    def _build_static_index(self, protocol_version):
+        """
+        Index the viewer files once.
+        
+        Returns (index, gzip_cache): URL path -> (file path, size, mtime in ns, content type,
+        ETag, cache policy, 200 header block), and URL path -> (gzip-compressed body,
+        200 header block) for text assets.
+        """
+        index = {}
+        gzip_cache = {}
+        for file_path in self.viewer_dir.rglob('*'):
+            if not file_path.is_file():
+                continue
+            with open(file_path, 'rb') as f:
+                data = f.read()
+                # Requests compare against this to notice files changed after startup
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+            rel_path = file_path.relative_to(self.viewer_dir).as_posix()
+            content_type = _content_type(rel_path)
+            etag = f'"{digest}"'
+            cache_control = _cache_control(rel_path)
+            if file_path.suffix.lower() in GZIP_SUFFIXES:
+                compressed = gzip.compress(data, compresslevel=9)
+                # Keep the variant only when it actually saves bytes
+                if len(compressed) < len(data):
+                    gzip_cache[rel_path] = (compressed, _header_block(
+                        protocol_version, content_type, len(compressed),
+                        etag[:-1] + '-gz"', cache_control, encoding='gzip'
+                    ))
+            index[rel_path] = (
+                str(file_path),
+                len(data),
+                mtime_ns,
+                content_type,
+                etag,
+                cache_control,
+                _header_block(protocol_version, content_type, len(data), etag, cache_control,
+                              vary=rel_path in gzip_cache),
+            )
+        return index, gzip_cache
     
     def load_gltf(self, file_path: str):
         """Load GLTF file - show in embedded area."""
@@ -192,6 +454,7 @@ Model information will be displayed in the sidebar."""
             return False
         
         self.current_file = file_path
+        self._stats_shown = False
         filename = os.path.basename(file_path)
         
         # Update display
@@ -201,13 +464,16 @@ Model information will be displayed in the sidebar."""
         )
         
         # Update info text
+        details = f"File: {filename}\nPath: {file_path}"
         self.info_text.configure(state="normal")
-        self.info_text.delete("1.0", "end")
-        
-        info = f"""GLTF Model Loaded
-
-File: {filename}
-Path: {file_path}
+        if self._info_layout == "model":
+            # Same layout as the previous model: swap the file lines, drop the old stats
+            self.info_text.delete("file_start", "file_end")
+            self.info_text.insert("file_start", details)
+            self.info_text.delete("stats_start", "end")
+        else:
+            header = "GLTF Model Loaded\n\n"
+            info = header + details + f"""
 
 Model loaded successfully!
 
@@ -224,14 +490,21 @@ Use toolbar buttons to:
 • Reset View
 • Toggle Wireframe
 • Clear Model"""
-        
-        self.info_text.insert("1.0", info)
+            
+            self.info_text.delete("1.0", "end")
+            self.info_text.insert("1.0", info)
+            # Marks around the parts that change from one model to the next
+            self.info_text.mark_set("file_start", f"1.0+{len(header)}c")
+            self.info_text.mark_gravity("file_start", "left")
+            self.info_text.mark_set("file_end", f"file_start+{len(details)}c")
+            self.info_text.mark_set("stats_start", "end-1c")
+            self.info_text.mark_gravity("stats_start", "left")
+            self._info_layout = "model"
         self.info_text.configure(state="disabled")
         
         # If server is running, prepare URL
         if self.server_port:
             file_url = Path(file_path).absolute().as_uri()
-            from urllib.parse import quote
             encoded_url = quote(file_url, safe='')
             viewer_url = f"http://localhost:{self.server_port}/index.html?file={encoded_url}"
             
@@ -261,11 +534,14 @@ Use toolbar buttons to:
         """Clear current model."""
         self.current_file = None
         self.model_stats = None
+        self._stats_shown = False
         self.status_label.configure(
             text="Ready - No model loaded",
             text_color="gray"
         )
         
+        if self._info_layout == "cleared":
+            return
         self.info_text.configure(state="normal")
         self.info_text.delete("1.0", "end")
         info = """GLTF 3D Viewer
@@ -275,6 +551,7 @@ Click 'Open GLTF/GLB' to load a 3D model.
 The viewer will display model information here once loaded."""
         self.info_text.insert("1.0", info)
         self.info_text.configure(state="disabled")
+        self._info_layout = "cleared"
     
     def on_model_loaded_callback(self, stats: dict):
         """Called when model loads."""
@@ -283,7 +560,7 @@ The viewer will display model information here once loaded."""
             self.on_model_loaded(stats)
         
         # Update display with stats
-        if self.current_file:
+        if self.current_file and not self._stats_shown:
             filename = os.path.basename(self.current_file)
             stats_text = f"\n\nModel Statistics:\n"
             stats_text += f"Vertices: {stats.get('vertices', 0):,}\n"
@@ -292,10 +569,9 @@ The viewer will display model information here once loaded."""
             stats_text += f"Textures: {stats.get('textures', 0)}\n"
             
             self.info_text.configure(state="normal")
-            content = self.info_text.get("1.0", "end")
-            if stats_text not in content:
-                self.info_text.insert("end", stats_text)
+            self.info_text.insert("end", stats_text)
             self.info_text.configure(state="disabled")
+            self._stats_shown = True
     
     def on_model_error_callback(self, error: str):
         """Called on model error."""
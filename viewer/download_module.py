@@ -2,18 +2,60 @@
 """Download three.module.js for ES module compatibility"""
 import urllib.request
 import os
+import sys
+import gzip
+import hashlib
+import tempfile
 
 url = 'https://cdn.jsdelivr.net/npm/three@0.150.0/build/three.module.js'
 filename = 'three.module.js'
+# blake2b (16-byte) hex digest of the file; set it to pin the download
+expected_digest = None
 
 print(f'Downloading {filename}...')
+# Download next to the target and only replace it once verified, so a failed
+# transfer never clobbers a good copy
+fd, temp_name = tempfile.mkstemp(prefix=f'.{filename}.', suffix='.part',
+                                 dir=os.path.dirname(os.path.abspath(filename)))
 try:
-    urllib.request.urlretrieve(url, filename)
-    if os.path.exists(filename):
-        size = os.path.getsize(filename)
-        print(f'Success! Downloaded {filename} ({size:,} bytes)')
-    else:
-        print('Error: File not found after download')
+    request = urllib.request.Request(url, headers={'Accept-Encoding': 'gzip'})
+    with os.fdopen(fd, 'wb') as f, urllib.request.urlopen(request) as response:
+        if response.status != 200:
+            raise RuntimeError(f'HTTP {response.status}')
+        source = response
+        expected_size = None
+        if response.headers.get('Content-Encoding') == 'gzip':
+            source = gzip.GzipFile(fileobj=response)
+        else:
+            length = response.headers.get('Content-Length')
+            if length:
+                expected_size = int(length)
+                # Reserve the space up front when the size is known
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(f.fileno(), 0, expected_size)
+        # Stream to disk in 1 MiB chunks, hashing on the way
+        digest = hashlib.blake2b(digest_size=16)
+        size = 0
+        while chunk := source.read(1 << 20):
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+        # Drop any preallocated tail a short transfer didn't fill
+        f.truncate(size)
+    if expected_size is not None and size != expected_size:
+        raise RuntimeError(f'Incomplete download ({size:,} of {expected_size:,} bytes)')
+    if expected_digest and digest.hexdigest() != expected_digest:
+        raise RuntimeError(f'Checksum mismatch ({digest.hexdigest()})')
+    # mkstemp creates the file owner-only; give it the mode a plain open() would have
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temp_name, 0o666 & ~umask)
+    os.replace(temp_name, filename)
+    print(f'Success! Downloaded {filename} ({size:,} bytes, blake2b {digest.hexdigest()})')
 except Exception as e:
     print(f'Error downloading: {e}')
-
+    try:
+        os.remove(temp_name)
+    except OSError:
+        pass
+    sys.exit(1)
@@ -409,6 +409,48 @@ GLTFViewer.prototype.setupMessageListener = function() {
 // Initialize viewer when page loads
 let viewer;
 
+// Resolves with the viewer once initViewer has run, so hosts can queue calls on it
+window.viewerReadyPromise = window.viewerReadyPromise || new Promise((resolve) => {
+    window.addEventListener('viewerReady', () => resolve(window.viewer), { once: true });
+});
+
+// Host command table: one short call per action instead of re-sending guard code each time
+window.__v = {
+    load: (url) => window.viewerReadyPromise.then((v) => v.loadGLTF(url)),
+    reset: () => window.viewer && window.viewer.resetView(),
+    wire: () => window.viewer && window.viewer.toggleWireframe(),
+    clear: () => {
+        if (window.viewer) {
+            window.viewer.clear();
+        }
+        // Forget remembered material and part colors
+        try {
+            localStorage.removeItem('materialManager_colors');
+            localStorage.removeItem('materialManager_partColors');
+            console.log('Browser cache cleared');
+        } catch (e) {
+            console.warn('Failed to clear browser cache:', e);
+        }
+    }
+};
+
+// Hosts that slow their message pump while idle (the CEF viewer) expose
+// window.onViewerActivity; ping it, at most every 250 ms, while the user interacts
+(function reportViewerActivity() {
+    let lastReport = 0;
+    const report = () => {
+        const now = Date.now();
+        if (now - lastReport < 250 || typeof window.onViewerActivity !== 'function') {
+            return;
+        }
+        lastReport = now;
+        window.onViewerActivity();
+    };
+    ['pointerdown', 'pointermove', 'wheel', 'keydown'].forEach((type) => {
+        window.addEventListener(type, report, { capture: true, passive: true });
+    });
+})();
+
 // Check if file URL is in URL parameters
 function getFileUrlFromParams() {
     const urlParams = new URLSearchParams(window.location.search);
@@ -487,6 +529,23 @@ function initViewer() {
                 }
                 console.log('Viewer initialized');
                 
+                // Let listeners and embedding hosts know viewer.loadGLTF can be called now
+                window.dispatchEvent(new Event('viewerReady'));
+                if (typeof window.onViewerReady === 'function') {
+                    window.onViewerReady();
+                }
+                // pywebview hosts get the signal through the js_api bridge, which may be injected later
+                const notifyPywebview = () => {
+                    if (window.pywebview && window.pywebview.api && window.pywebview.api.onViewerReady) {
+                        window.pywebview.api.onViewerReady();
+                    }
+                };
+                if (window.pywebview && window.pywebview.api) {
+                    notifyPywebview();
+                } else {
+                    window.addEventListener('pywebviewready', notifyPywebview, { once: true });
+                }
+                
                 // Check for file in URL parameters
                 const fileUrl = getFileUrlFromParams();
                 if (fileUrl) {